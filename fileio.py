@@ -1,6 +1,13 @@
+import numpy as np
 import pandas as pd
+import openpyxl
+import shapely
 from shapely.geometry import LineString, Point
 
+# Record layouts of the distributed load and reinforcement line point arrays
+DLOAD_DTYPE = np.dtype([('X', np.float64), ('Y', np.float64), ('Normal', np.float64)])
+REINFORCE_DTYPE = np.dtype([('X', np.float64), ('Y', np.float64), ('FL', np.float64), ('FT', np.float64)])
+
 def build_ground_surface(profile_lines):
     """
     Constructs the topmost ground surface LineString from a set of profile lines.
@@ -16,57 +23,77 @@ def build_ground_surface(profile_lines):
         shapely.geometry.LineString: A LineString of the top surface, or an empty LineString
         if fewer than two valid points are found.
     """
-    
-    if not profile_lines:
+    # Repeated lines (e.g. a boundary entered for two layers) cannot change the result,
+    # so only the first copy of each is kept.
+    profiles = tuple(dict.fromkeys(tuple(map(tuple, line)) for line in profile_lines))
+
+    # Lines with fewer than two distinct points have no length and cannot bury anything,
+    # so they are left out of the line arrays; their points are still surface candidates.
+    lines = [line for line in profiles if len(set(line)) >= 2]
+    loose_points = [pt for line in profiles if len(set(line)) < 2 for pt in line]
+
+    # Step 1: Gather all points from all profile lines, sorted by x ascending then y descending
+    px, py, offsets = flatten_profiles(lines)
+    cx = np.concatenate([px, [x for x, _ in loose_points]])
+    cy = np.concatenate([py, [y for _, y in loose_points]])
+    if len(cx) < 2:
         return LineString([])
-    
-    # Step 1: Gather all points from all profile lines
-    all_points = []
-    for line in profile_lines:
-        all_points.extend(line)
-    
-    # Step 2: Group points by x-coordinate and find the highest y for each x
-    x_groups = {}
-    for x, y in all_points:
-        if x not in x_groups:
-            x_groups[x] = y
-        else:
-            x_groups[x] = max(x_groups[x], y)
-    
-    # Step 3: For each candidate point, check if any profile line is above it
-    ground_surface_points = []
-    for x, y in sorted(x_groups.items()):
-        # Create a vertical line at this x-coordinate
-        vertical_line = LineString([(x, y - 1000), (x, y + 1000)])
-        
-        # Check intersections with all profile lines
-        is_topmost = True
-        for profile_line in profile_lines:
-            line = LineString(profile_line)
-            if line.length == 0:
-                continue
-            
-            # Find intersection with this profile line
-            intersection = line.intersection(vertical_line)
-            if not intersection.is_empty:
-                # Get the y-coordinate of the intersection
-                if hasattr(intersection, 'y'):
-                    # Single point intersection
-                    if intersection.y > y + 1e-6:  # Allow small numerical tolerance
-                        is_topmost = False
-                        break
-                elif hasattr(intersection, 'geoms'):
-                    # Multiple points or line intersection
-                    for geom in intersection.geoms:
-                        if hasattr(geom, 'y') and geom.y > y + 1e-6:
-                            is_topmost = False
-                            break
-                    if not is_topmost:
-                        break
-        
-        if is_topmost:
-            ground_surface_points.append((x, y))
-    
+    order = np.lexsort((-cy, cx))
+    cx, cy = cx[order], cy[order]
+
+    # Step 2: The first point of each x is the highest y for that x
+    first = np.empty(len(order), dtype=bool)
+    first[0] = True
+    first[1:] = cx[1:] != cx[:-1]
+    xs, ys = cx[first], cy[first]
+    # A single line ordered by x cannot pass above its own vertices, so its top points are the surface
+    if not lines or (len(lines) == 1 and not loose_points and np.all(np.diff(px) >= 0)):
+        return LineString(np.column_stack([xs, ys])) if len(xs) >= 2 else LineString([])
+
+    # Elevation a line must exceed to bury each candidate (allow small numerical tolerance)
+    ys_tol = ys + 1e-6
+
+    # Step 3: For each candidate point, check if any profile line is above it.
+    # Profile lines are normally functions of x (vertices ordered left to right or right to
+    # left), so the elevation of each line at every candidate x is a 1-D piecewise-linear
+    # interpolation; any other line falls back to an exact intersection test. The candidates
+    # are sorted, so the ones strictly inside a line's x-range are a contiguous slice found
+    # by binary search; candidates outside it are skipped for that line (no extrapolation).
+    # The endpoints are skipped too: each is a candidate itself, so the top y there is never
+    # below it.
+    # Lines are checked from the highest elevation down. The upper layers reject most
+    # buried points first, so later lines only need to be evaluated at the survivors,
+    # and only at those lying below the line's highest point.
+    line_max_y = np.maximum.reduceat(py, offsets[:-1])
+
+    keep = np.ones(len(xs), dtype=bool)
+    for i in np.argsort(-line_max_y, kind='stable'):
+        lx, ly = px[offsets[i]:offsets[i + 1]], py[offsets[i]:offsets[i + 1]]
+        dx = np.diff(lx)
+        if np.all(dx <= 0) and not np.all(dx >= 0):
+            lx, ly = lx[::-1], ly[::-1]
+        elif not np.all(dx >= 0):
+            # Not a function of x: intersect a vertical line at each candidate with the polyline
+            lo = np.searchsorted(xs, lx.min(), side='left')
+            hi = np.searchsorted(xs, lx.max(), side='right')
+            line = LineString(np.column_stack([lx, ly]))
+            for j in lo + np.flatnonzero(keep[lo:hi] & (ys_tol[lo:hi] < line_max_y[i])):
+                intersection = line.intersection(LineString([(xs[j], ys[j] - 1000), (xs[j], ys[j] + 1000)]))
+                if intersection.is_empty:
+                    continue
+                geoms = intersection.geoms if hasattr(intersection, 'geoms') else [intersection]
+                if any(hasattr(geom, 'y') and geom.y > ys_tol[j] for geom in geoms):
+                    keep[j] = False
+            continue
+        lo = np.searchsorted(xs, lx[0], side='right')
+        hi = np.searchsorted(xs, lx[-1], side='left')
+        idx = lo + np.flatnonzero(keep[lo:hi] & (ys_tol[lo:hi] < line_max_y[i]))
+        if idx.size == 0:
+            continue
+        y_on_line = np.interp(xs[idx], lx, ly)
+        keep[idx[y_on_line > ys_tol[idx]]] = False
+    ground_surface_points = np.column_stack([xs[keep], ys[keep]])
+
     # Ensure we have at least 2 points
     if len(ground_surface_points) < 2:
         return LineString([])
@@ -74,6 +101,86 @@ def build_ground_surface(profile_lines):
     return LineString(ground_surface_points)
 
 
+def flatten_profiles(profile_lines):
+    """
+    Packs a set of profile lines into flat coordinate arrays with CSR-style offsets.
+
+    Parameters:
+        profile_lines (sequence of sequence of tuple): Profile lines, each a sequence of (x, y) pairs.
+
+    Returns:
+        tuple: (xs, ys, offsets) where xs and ys are float64 arrays of every vertex and line i
+        occupies xs[offsets[i]:offsets[i + 1]] (offsets is int64 with length len(profile_lines) + 1).
+    """
+    offsets = np.zeros(len(profile_lines) + 1, dtype=np.int64)
+    np.cumsum([len(line) for line in profile_lines], out=offsets[1:])
+    coords = np.fromiter(
+        (v for line in profile_lines for pt in line for v in pt), dtype=np.float64, count=2 * offsets[-1]
+    ).reshape(-1, 2)
+    return np.ascontiguousarray(coords[:, 0]), np.ascontiguousarray(coords[:, 1]), offsets
+
+
+def read_sheet_rows(wb, sheet_name, max_row=None, max_col=None):
+    """
+    Reads the rows of a worksheet from a read-only openpyxl workbook.
+
+    Trailing empty cells and rows are trimmed, rows are padded to a common width (max_col
+    if given), and empty cells are returned as NaN, matching pandas.read_excel(header=None).
+    Row/column positions follow the Excel layout (row 1 = index 0, column A = index 0).
+
+    Parameters:
+        wb (openpyxl.Workbook): Workbook opened with read_only=True.
+        sheet_name (str): Name of the worksheet to read.
+        max_row (int, optional): Last Excel row to read (1-based). Rows below it are never parsed.
+        max_col (int, optional): Last Excel column to read (1-based). Cells to the right are skipped.
+
+    Returns:
+        list of list: Cell values for each row of the sheet.
+    """
+    ws = wb[sheet_name]
+    ws.reset_dimensions()  # dimension tags written by some tools are unreliable
+    rows = []
+    for row in ws.iter_rows(max_row=max_row, max_col=max_col, values_only=True):
+        row = list(row)
+        while row and row[-1] is None:
+            row.pop()
+        rows.append(row)
+    while rows and not rows[-1]:
+        rows.pop()
+    width = max_col if max_col is not None else max((len(row) for row in rows), default=0)
+    return [[np.nan if v is None else v for v in row] + [np.nan] * (width - len(row)) for row in rows]
+
+
+def rows_to_xy(arr):
+    """
+    Converts an (n, 2) float array of coordinate rows into a list of (x, y) tuples.
+
+    Parameters:
+        arr (np.ndarray): Array whose first two columns are x and y.
+
+    Returns:
+        list of tuple: (x, y) coordinate pairs as Python floats.
+    """
+    return list(zip(arr[:, 0].tolist(), arr[:, 1].tolist()))
+
+
+def rows_to_records(arr, dtype):
+    """
+    Converts a float array of point rows into a structured array, one field per column.
+
+    Parameters:
+        arr (np.ndarray): (n, k) array whose columns are in the order of the dtype fields.
+        dtype (np.dtype): Structured dtype with k float fields (DLOAD_DTYPE or REINFORCE_DTYPE).
+
+    Returns:
+        np.ndarray: Structured array of n points. Fields are read as arr['X'], and a single
+        point as arr[i]['X'].
+    """
+    records = np.empty(len(arr), dtype=dtype)
+    for j, name in enumerate(dtype.names):
+        records[name] = arr[:, j]
+    return records
+
 
 def load_globals(filepath):
     """
@@ -97,49 +204,76 @@ def load_globals(filepath):
         dict: Parsed and validated global data structure for analysis
     """
 
-    xls = pd.ExcelFile(filepath)
+    # === SHEET LAYOUTS ===
+    # Row indices are 0-based (Excel row - 1); end rows are exclusive.
+    profile_data_blocks = [
+        {"header_row": 2, "data_start": 3, "data_end": 18},
+        {"header_row": 20, "data_start": 21, "data_end": 36}
+    ]
+    profile_block_width = 3
+    dload_data_blocks = [
+        {"start_row": 3, "end_row": 13},
+        {"start_row": 16, "end_row": 26}
+    ]
+    dload_block_starts = [1, 5, 9, 13]
+    reinforce_data_blocks = [
+        {"start_row": 3, "end_row": 13},
+        {"start_row": 16, "end_row": 26},
+        {"start_row": 29, "end_row": 39}
+    ]
+    reinforce_block_starts = [1, 6, 11, 16]
+
+    # Open the workbook once in read-only mode and materialize only the cells each
+    # sheet's layout uses, so rows and columns outside the known blocks are never parsed.
+    wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        main_rows = read_sheet_rows(wb, 'main', max_row=21, max_col=4)
+        profile_rows = read_sheet_rows(wb, 'profile', max_row=max(b["data_end"] for b in profile_data_blocks))
+        mat_rows = read_sheet_rows(wb, 'mat', max_col=17)
+        piezo_rows = read_sheet_rows(wb, 'piezo', max_row=19, max_col=5)
+        dload_rows = read_sheet_rows(wb, 'dloads', max_row=max(b["end_row"] for b in dload_data_blocks),
+                                     max_col=max(dload_block_starts) + 3)
+        circles_rows = read_sheet_rows(wb, 'circles', max_col=8)
+        noncirc_rows = read_sheet_rows(wb, 'non-circ', max_col=3)
+        reinforce_rows = read_sheet_rows(wb, 'reinforce', max_row=max(b["end_row"] for b in reinforce_data_blocks),
+                                         max_col=max(reinforce_block_starts) + 4)
+    finally:
+        wb.close()
+
     globals_data = {}
 
     # === STATIC GLOBALS ===
-    main_df = xls.parse('main', header=None)
-
     try:
-        template_version = main_df.iloc[4, 3]  # Excel row 5, column D
-        gamma_water = float(main_df.iloc[17, 3])  # Excel row 18, column D
-        tcrack_depth = float(main_df.iloc[18, 3])  # Excel row 19, column D
-        tcrack_water = float(main_df.iloc[19, 3])  # Excel row 20, column D
-        k_seismic = float(main_df.iloc[20, 3])  # Excel row 21, column D
+        template_version = main_rows[4][3]  # Excel row 5, column D
+        gamma_water = float(main_rows[17][3])  # Excel row 18, column D
+        tcrack_depth = float(main_rows[18][3])  # Excel row 19, column D
+        tcrack_water = float(main_rows[19][3])  # Excel row 20, column D
+        k_seismic = float(main_rows[20][3])  # Excel row 21, column D
     except Exception as e:
         raise ValueError(f"Error reading static global values from 'main' tab: {e}")
 
 
     # === PROFILE LINES ===
-    profile_df = xls.parse('profile', header=None)
     profile_lines = []
-
-    profile_data_blocks = [
-        {"header_row": 2, "data_start": 3, "data_end": 18},
-        {"header_row": 20, "data_start": 21, "data_end": 36}
-    ]
-    profile_block_width = 3
+    profile_n_cols = len(profile_rows[0]) if profile_rows else 0
 
     for block in profile_data_blocks:
-        for col in range(0, profile_df.shape[1], profile_block_width):
+        for col in range(0, profile_n_cols, profile_block_width):
             x_col, y_col = col, col + 1
             try:
-                x_header = str(profile_df.iloc[block["header_row"], x_col]).strip().lower()
-                y_header = str(profile_df.iloc[block["header_row"], y_col]).strip().lower()
+                x_header = str(profile_rows[block["header_row"]][x_col]).strip().lower()
+                y_header = str(profile_rows[block["header_row"]][y_col]).strip().lower()
             except:
                 continue
             if x_header != 'x' or y_header != 'y':
                 continue
-            data = profile_df.iloc[block["data_start"]:block["data_end"], [x_col, y_col]]
-            data = data.dropna(how='all')
-            if data.empty:
+            data = [(row[x_col], row[y_col]) for row in profile_rows[block["data_start"]:block["data_end"]]]
+            data = [pt for pt in data if not (pd.isna(pt[0]) and pd.isna(pt[1]))]
+            if not data:
                 continue
-            if data.iloc[0].isna().any():
+            if pd.isna(data[0][0]) or pd.isna(data[0][1]):
                 continue
-            coords = data.dropna().apply(lambda r: (float(r.iloc[0]), float(r.iloc[1])), axis=1).tolist()
+            coords = [(float(x), float(y)) for x, y in data if not (pd.isna(x) or pd.isna(y))]
             if len(coords) == 1:
                 raise ValueError("Each profile line must contain at least two points.")
             if coords:
@@ -153,43 +287,43 @@ def load_globals(filepath):
 
     tcrack_surface = None
     if tcrack_depth > 0:
-        tcrack_surface = LineString([(x, y - tcrack_depth) for (x, y) in ground_surface.coords])
+        if ground_surface.is_empty:
+            tcrack_surface = LineString()
+        else:
+            tcrack_coords = shapely.get_coordinates(ground_surface)
+            tcrack_coords[:, 1] -= tcrack_depth
+            tcrack_surface = shapely.linestrings(tcrack_coords)
 
     # === MATERIALS (Optimized Parsing) ===
-    mat_df = xls.parse('mat', header=2)
-    materials = []
-
-    for _, row in mat_df.iterrows():
-        # Check if the row is blank (columns 2-17, which are indices 1-16)
-        if row.iloc[1:17].isna().all():
-            continue
-            
-        materials.append({
-            "name": row.get('name', ''),
-            "gamma": float(row.get('g', 0) or 0),
-            "option": str(row.get('option', '')).strip().lower(),
-            "c": float(row.get('c', 0) or 0),
-            "phi": float(row.get('f', 0) or 0),
-            "cp": float(row.get('cp', 0) or 0),
-            "r_elev": float(row.get('r-elev', 0) or 0),
-            "d": float(row.get('d', 0)) if pd.notna(row.get('d')) else 0,
-            "psi": float(row.get('ψ', 0)) if pd.notna(row.get('ψ')) else 0,
-            "piezo": float(row.get('piezo', 1.0) or 1.0),
-            "sigma_gamma": float(row.get('s(g)', 0) or 0),
-            "sigma_c": float(row.get('s(c)', 0) or 0),
-            "sigma_phi": float(row.get('s(f)', 0) or 0),
-            "sigma_cp": float(row.get('s(cp)', 0) or 0),
-            "sigma_d": float(row.get('s(d)', 0) or 0),
-            "sigma_psi": float(row.get('s(ψ)', 0) or 0),
-        })
+    # Excel row 3 holds the column names; the material table starts on row 4
+    mat_df = pd.DataFrame(mat_rows[3:], columns=mat_rows[2]) if len(mat_rows) > 2 else pd.DataFrame()
+
+    # Coerce each numeric column once (missing columns take their default) instead of per cell
+    mat_num_cols = {'gamma': 'g', 'c': 'c', 'phi': 'f', 'cp': 'cp', 'r_elev': 'r-elev', 'd': 'd',
+                    'psi': 'ψ', 'piezo': 'piezo', 'sigma_gamma': 's(g)', 'sigma_c': 's(c)',
+                    'sigma_phi': 's(f)', 'sigma_cp': 's(cp)', 'sigma_d': 's(d)', 'sigma_psi': 's(ψ)'}
+    mat_num = pd.DataFrame(
+        {key: pd.to_numeric(mat_df[col]) if col in mat_df.columns else (1.0 if key == 'piezo' else 0.0)
+         for key, col in mat_num_cols.items()},
+        index=mat_df.index
+    ).astype(float)
+    mat_num[['d', 'psi']] = mat_num[['d', 'psi']].fillna(0.0)
+    mat_num['piezo'] = mat_num['piezo'].replace(0.0, 1.0)
+
+    # A row is blank if columns 2-17 (indices 1-16) are all empty
+    mat_keep = ~mat_df.iloc[:, 1:17].isna().all(axis=1)
+    mat_num = mat_num[mat_keep]
+    mat_num.insert(0, 'name', mat_df['name'][mat_keep] if 'name' in mat_df.columns else '')
+    mat_num.insert(2, 'option', mat_df['option'][mat_keep].astype(str).str.strip().str.lower()
+                   if 'option' in mat_df.columns else '')
+    materials = mat_num.to_dict('records')
 
     # === PIEZOMETRIC LINE ===
-    piezo_df = xls.parse('piezo')
     piezo_line = []
     piezo_line2 = []
 
     # Read all data once (rows 4-18)
-    piezo_data = piezo_df.iloc[2:18].dropna(how='all')
+    piezo_data = pd.DataFrame(piezo_rows[3:19]).dropna(how='all')
     
     if len(piezo_data) >= 2:
         # Extract first table (A4:B18) - columns 0 and 1
@@ -197,7 +331,7 @@ def load_globals(filepath):
             piezo_data1 = piezo_data.dropna(subset=[piezo_data.columns[0], piezo_data.columns[1]], how='all')
             if len(piezo_data1) < 2:
                 raise ValueError("First piezometric line must contain at least two points.")
-            piezo_line = piezo_data1.apply(lambda row: (float(row.iloc[0]), float(row.iloc[1])), axis=1).tolist()
+            piezo_line = rows_to_xy(piezo_data1.iloc[:, [0, 1]].to_numpy(dtype=float))
         except Exception:
             raise ValueError("Invalid first piezometric line format.")
 
@@ -206,7 +340,7 @@ def load_globals(filepath):
             piezo_data2 = piezo_data.dropna(subset=[piezo_data.columns[3], piezo_data.columns[4]], how='all')
             if len(piezo_data2) < 2:
                 raise ValueError("Second piezometric line must contain at least two points.")
-            piezo_line2 = piezo_data2.apply(lambda row: (float(row.iloc[3]), float(row.iloc[4])), axis=1).tolist()
+            piezo_line2 = rows_to_xy(piezo_data2.iloc[:, [3, 4]].to_numpy(dtype=float))
         except Exception:
             # If second table reading fails, just leave piezo_line2 as empty list
             piezo_line2 = []
@@ -214,14 +348,9 @@ def load_globals(filepath):
         raise ValueError("Piezometric line must contain at least two points.")
 
     # === DISTRIBUTED LOADS ===
-    dload_df = xls.parse('dloads', header=None)
+    dload_df = pd.DataFrame(dload_rows)
     dloads = []
     dloads2 = []
-    dload_data_blocks = [
-        {"start_row": 3, "end_row": 13},
-        {"start_row": 16, "end_row": 26}
-    ]
-    dload_block_starts = [1, 5, 9, 13]
 
     for block_idx, block in enumerate(dload_data_blocks):
         for col in dload_block_starts:
@@ -230,12 +359,7 @@ def load_globals(filepath):
             section = section.dropna(subset=[col, col + 1], how='any')
             if len(section) >= 2:
                 try:
-                    block_points = section.apply(
-                        lambda row: {
-                            "X": float(row.iloc[0]),
-                            "Y": float(row.iloc[1]),
-                            "Normal": float(row.iloc[2])
-                        }, axis=1).tolist()
+                    block_points = rows_to_records(section.to_numpy(dtype=float), DLOAD_DTYPE)
                     if block_idx == 0:
                         dloads.append(block_points)
                     else:
@@ -247,58 +371,53 @@ def load_globals(filepath):
 
     # === CIRCLES ===
 
-    # Read the first 3 rows to get the max depth
-    raw_df = xls.parse('circles', header=None)  # No header, get full sheet
-    max_depth = float(raw_df.iloc[1, 2])  # Excel C2 = row 1, column 2
+    # Read the max depth from the first rows
+    max_depth = float(circles_rows[1][2])  # Excel C2 = row 1, column 2
 
-    # Read the circles data starting from row 4 (index 3)
-    circles_df = xls.parse('circles', header=3)
+    # The circles table header is on Excel row 4 (index 3), data follows
+    circles_header = [str(h).strip() for h in circles_rows[3]]
+    circles_df = pd.DataFrame(circles_rows[4:], columns=circles_header)
     raw = circles_df.dropna(subset=['Xo', 'Yo'], how='any')
-    circles = []
-    for _, row in raw.iterrows():
-        Xo = row['Xo']
-        Yo = row['Yo']
-        Option = row.get('Option', None)
-        Depth = row.get('Depth', None)
-        Xi = row.get('Xi', None)
-        Yi = row.get('Yi', None)
-        R = row.get('R', None)
-        # For each circle, fill in the radius and depth values depending on the circle option
-        if Option == 'Depth':
-            R = Yo - Depth
-        elif Option == 'Intercept':
-            R = ((Xi - Xo) ** 2 + (Yi - Yo) ** 2) ** 0.5
-            Depth = Yo - R
-        elif Option == 'Radius':
-            Depth = Yo - R
-        else:
-            raise ValueError(f"Unknown option '{Option}' for circles.")
-        circle = {
-            "Xo": Xo,
-            "Yo": Yo,
-            "Depth": Depth,
-            "R": R,
-        }
-        circles.append(circle)
+    Xo = raw['Xo'].to_numpy(dtype=float)
+    Yo = raw['Yo'].to_numpy(dtype=float)
+    # Columns a circle's option does not need may be missing from the sheet
+    Option = raw['Option'].to_numpy(dtype=object) if 'Option' in raw else np.full(len(raw), None, dtype=object)
+    Depth = raw['Depth'].to_numpy(dtype=float) if 'Depth' in raw else np.full(len(raw), np.nan)
+    Xi = raw['Xi'].to_numpy(dtype=float) if 'Xi' in raw else np.full(len(raw), np.nan)
+    Yi = raw['Yi'].to_numpy(dtype=float) if 'Yi' in raw else np.full(len(raw), np.nan)
+    R = raw['R'].to_numpy(dtype=float) if 'R' in raw else np.full(len(raw), np.nan)
+
+    # Fill in the radius and depth values of every circle at once depending on the circle option
+    m_depth = Option == 'Depth'
+    m_int = Option == 'Intercept'
+    m_rad = Option == 'Radius'
+    unknown = ~(m_depth | m_int | m_rad)
+    if unknown.any():
+        raise ValueError(f"Unknown option '{Option[unknown][0]}' for circles.")
+    for option, mask, needed in [('Depth', m_depth, ['Depth']), ('Intercept', m_int, ['Xi', 'Yi']),
+                                 ('Radius', m_rad, ['R'])]:
+        missing = [col for col in needed if col not in raw]
+        if mask.any() and missing:
+            raise ValueError(f"Circles with option '{option}' need the '{missing[0]}' column.")
+    R = np.where(m_depth, Yo - Depth, np.where(m_int, np.hypot(Xi - Xo, Yi - Yo), R))
+    Depth = np.where(m_int | m_rad, Yo - R, Depth)
+
+    circles = [
+        {"Xo": xo, "Yo": yo, "Depth": depth, "R": r}
+        for xo, yo, depth, r in zip(Xo.tolist(), Yo.tolist(), Depth.tolist(), R.tolist())
+    ]
 
     # === NON-CIRCULAR SURFACES ===
-    noncirc_df = xls.parse('non-circ')
-    non_circ = list(noncirc_df.iloc[1:].dropna(subset=['Unnamed: 0']).apply(
-        lambda row: {
-            "X": float(row['Unnamed: 0']),
-            "Y": float(row['Unnamed: 1']),
-            "Movement": row['Unnamed: 2']
-        }, axis=1))
+    # Data starts on Excel row 3 in columns A-C
+    noncirc_arr = pd.DataFrame(noncirc_rows[2:], columns=[0, 1, 2]).dropna(subset=[0]).to_numpy(dtype=object)
+    non_circ = [
+        {"X": float(x), "Y": float(y), "Movement": movement}
+        for x, y, movement in noncirc_arr
+    ]
 
     # === REINFORCEMENT LINES ===
-    reinforce_df = xls.parse('reinforce', header=None)
+    reinforce_df = pd.DataFrame(reinforce_rows)
     reinforce_lines = []
-    reinforce_data_blocks = [
-        {"start_row": 3, "end_row": 13},
-        {"start_row": 16, "end_row": 26},
-        {"start_row": 29, "end_row": 39}
-    ]
-    reinforce_block_starts = [1, 6, 11, 16]
 
     for block in reinforce_data_blocks:
         for col in reinforce_block_starts:
@@ -307,13 +426,7 @@ def load_globals(filepath):
             section = section.dropna(subset=[col, col + 1], how='any')
             if len(section) >= 2:
                 try:
-                    line_points = section.apply(
-                        lambda row: {
-                            "X": float(row.iloc[0]),
-                            "Y": float(row.iloc[1]),
-                            "FL": float(row.iloc[2]),
-                            "FT": float(row.iloc[3])
-                        }, axis=1).tolist()
+                    line_points = rows_to_records(section.to_numpy(dtype=float), REINFORCE_DTYPE)
                     reinforce_lines.append(line_points)
                 except:
                     raise ValueError("Invalid data format in reinforcement block.")
@@ -36,10 +36,10 @@ circles = []
 non_circ = []
 # Example: non_circ = [{'X': 120, 'Y': 80, 'Movement': "Free"}, {'X': 130, 'Y': 90, 'Movement': "Horiz"}]
 
-#: List of distributed load dictionaries.
+#: List of distributed load lines, each a structured array with fields 'X', 'Y', 'Normal'.
 dloads = []
-# Example: dloads = [{'X': 120, 'Y': 80, 'Normal': 100}, {'X': 130, 'Y': 90, 'Normal': 150}]
+# Example: dloads = [np.array([(120, 80, 100), (130, 90, 150)], dtype=fileio.DLOAD_DTYPE)]
 
-#: List of reinforcement line dictionaries.
+#: List of reinforcement lines, each a structured array with fields 'X', 'Y', 'FL', 'FT'.
 reinforce_lines = []
-# Example: reinforce_lines = [{'X': 120, 'Y': 80, 'FL': 10, 'FT': 20}, {'X': 130, 'Y': 90, 'FL': 15, 'FT': 25}]
+# Example: reinforce_lines = [np.array([(120, 80, 10, 20), (130, 90, 15, 25)], dtype=fileio.REINFORCE_DTYPE)]
@@ -2,11 +2,11 @@ from global_config import non_circ
 from slice import generate_slices
 from fileio import load_globals
 from plot import plot_solution, plot_inputs
-from solve import oms, bishop, janbu, spencer, corps_engineers, lowe_karafiath
+from solve import oms, bishop, janbu, spencer, corps_engineers, lowe_karafiath, prep_slice_arrays
 
 
-def solve_selected(func, df):
-    success, result = func(df)
+def solve_selected(func, df, arrays=None):
+    success, result = func(df, arrays=arrays)
     if not success:
         print(f'Error: {result}')
         return result
@@ -26,12 +26,13 @@ def solve_selected(func, df):
     return result
 
 def solve_all(df):
-    solve_selected(oms, df)
-    solve_selected(bishop, df)
-    solve_selected(janbu, df)
-    solve_selected(corps_engineers, df)
-    solve_selected(lowe_karafiath, df)
-    solve_selected(spencer, df)
+    arrays = prep_slice_arrays(df)
+    solve_selected(oms, df, arrays)
+    solve_selected(bishop, df, arrays)
+    solve_selected(janbu, df, arrays)
+    solve_selected(corps_engineers, df, arrays)
+    solve_selected(lowe_karafiath, df, arrays)
+    solve_selected(spencer, df, arrays)
 
 data = load_globals("docs/input_template_lface2.xlsx")
 
@@ -176,7 +176,7 @@ def plot_dloads(ax, dloads, data=None, max_height_frac=0.3):
 
     Parameters:
         ax: matplotlib Axes object
-        dloads: List of distributed load data points with X, Y, and Normal force components
+        dloads: List of distributed load lines, each a structured array with X, Y, and Normal fields
         data: Dictionary containing plot data (needed for ground_surface to calculate slope height)
         max_height_frac: Maximum arrow height as fraction of slope height (default 0.3)
 
@@ -199,13 +199,13 @@ def plot_dloads(ax, dloads, data=None, max_height_frac=0.3):
         # Fallback: find max load value across all dloads for scaling
         max_load = 0
         for line in dloads:
-            max_load = max(max_load, max(pt['Normal'] for pt in line))
+            max_load = max(max_load, line['Normal'].max())
         slope_height = max_load / 10  # Arbitrary scaling if no ground surface available
     
     # Find the maximum load value for scaling
     max_load = 0
     for line in dloads:
-        max_load = max(max_load, max(pt['Normal'] for pt in line))
+        max_load = max(max_load, line['Normal'].max())
     
     # Calculate maximum arrow height
     max_arrow_height = slope_height * max_height_frac
@@ -214,9 +214,9 @@ def plot_dloads(ax, dloads, data=None, max_height_frac=0.3):
         if len(line) < 2:
             continue
             
-        xs = [pt['X'] for pt in line]
-        ys = [pt['Y'] for pt in line]
-        ns = [pt['Normal'] for pt in line]
+        xs = line['X'].tolist()
+        ys = line['Y'].tolist()
+        ns = line['Normal'].tolist()
         
         # Process line segments
         for i in range(len(line) - 1):
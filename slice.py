@@ -249,9 +249,9 @@ def generate_slices(data, circle=None, non_circ=None, num_slices=40, debug=True)
         num_slices (int, optional): Desired number of slices to generate (default is 20).
         gamma_w (float, optional): Unit weight of water (default is 62.4).
         piezo_line (list, optional): List of (x, y) tuples defining the piezometric surface.
-        dloads (list, optional): List of distributed load lines, each a list of dicts with 'X', 'Y', and 'Normal'.
-        dloads2 (list, optional): Second list of distributed load lines, each a list of dicts with 'X', 'Y', and 'Normal'.
-        reinforce_lines (list, optional): List of reinforcement lines, each a list of dicts with 'X', 'Y', 'FL', and 'FT'.
+        dloads (list, optional): List of distributed load lines, each a structured array with fields 'X', 'Y', and 'Normal'.
+        dloads2 (list, optional): Second list of distributed load lines, each a structured array with fields 'X', 'Y', and 'Normal'.
+        reinforce_lines (list, optional): List of reinforcement lines, each a structured array with fields 'X', 'Y', 'FL', and 'FT'.
 
     Returns:
         tuple:
@@ -287,9 +287,9 @@ def generate_slices(data, circle=None, non_circ=None, num_slices=40, debug=True)
     reinf_lines_data = []
     if data.get("reinforce_lines"):
         for line in data["reinforce_lines"]:
-            xs = [pt["X"] for pt in line]
-            fls = [pt["FL"] for pt in line]
-            geom = LineString([(pt["X"], pt["Y"]) for pt in line])
+            xs = line["X"]
+            fls = line["FL"]
+            geom = LineString(np.column_stack([line["X"], line["Y"]]))
             reinf_lines_data.append({"xs": xs, "fls": fls, "geom": geom})
 
     ground_surface = LineString([(x, y) for x, y in ground_surface.coords])
@@ -332,15 +332,15 @@ def generate_slices(data, circle=None, non_circ=None, num_slices=40, debug=True)
     # Add transition points from dloads.
     if dloads:
         fixed_xs.update(
-            pt['X'] for line in dloads for pt in line
-            if x_min <= pt['X'] <= x_max
+            x for line in dloads for x in line['X'].tolist()
+            if x_min <= x <= x_max
         )
 
     # Add transition points from dloads2.
     if dloads2:
         fixed_xs.update(
-            pt['X'] for line in dloads2 for pt in line
-            if x_min <= pt['X'] <= x_max
+            x for line in dloads2 for x in line['X'].tolist()
+            if x_min <= x <= x_max
         )
 
     # Add transition points from non_circ.
@@ -382,16 +382,16 @@ def generate_slices(data, circle=None, non_circ=None, num_slices=40, debug=True)
     dload_interp_funcs = []
     if dloads:
         for line in dloads:
-            xs = [pt['X'] for pt in line]
-            normals = [pt['Normal'] for pt in line]
+            xs = line['X']
+            normals = line['Normal']
             dload_interp_funcs.append(lambda x, xs=xs, normals=normals: np.interp(x, xs, normals, left=0, right=0))
 
     # Interpolation functions for second set of distributed loads
     dload2_interp_funcs = []
     if dloads2:
         for line in dloads2:
-            xs = [pt['X'] for pt in line]
-            normals = [pt['Normal'] for pt in line]
+            xs = line['X']
+            normals = line['Normal']
             dload2_interp_funcs.append(lambda x, xs=xs, normals=normals: np.interp(x, xs, normals, left=0, right=0))
 
     # Generate slices
@@ -470,8 +470,8 @@ def generate_slices(data, circle=None, non_circ=None, num_slices=40, debug=True)
             if h > 0:
                 base_material_idx = mat_index
 
-        # Center of gravity
-        y_cg = (sum_gam_h_y) / sum_gam_h if sum_gam_h > 0 else None
+        # Center of gravity (a slice with no soil has no weight, so fall back to the base)
+        y_cg = (sum_gam_h_y) / sum_gam_h if sum_gam_h > 0 else y_cb
 
         # Distributed load
         qC = sum(func(x_c) for func in dload_interp_funcs) if dload_interp_funcs else 0   # intensity at center
@@ -652,9 +652,9 @@ def generate_slices(data, circle=None, non_circ=None, num_slices=40, debug=True)
             't': t_force,  # tension crack water force
             'y_t': y_t_loc,  # y-coordinate of the tension crack water force line of action
             'p': p_sum,   # sum of reinforcement line FL values that intersect base of slice.
-            'n_eff': 0, # Placeholder for effective normal force
-            'z': 0,     # Placeholder for interslice side forces
-            'theta': 0, # Placeholder for interslice angles
+            'n_eff': 0.0, # Placeholder for effective normal force
+            'z': 0.0,     # Placeholder for interslice side forces
+            'theta': 0.0, # Placeholder for interslice angles
             'piezo_y': piezo_y,  # y-coordinate of the piezometric surface at x_c
             'hw': hw,   # height of water at x_c
             'u': u,     # pore pressure at x_c
@@ -675,6 +675,13 @@ def generate_slices(data, circle=None, non_circ=None, num_slices=40, debug=True)
 
     df = pd.DataFrame(slices)
 
+    # Make sure every column read by the solvers is a plain float64 column, so they can be
+    # pulled out as arrays without per-call type checks or object-dtype arithmetic.
+    solver_cols = ['alpha', 'phi', 'c', 'w', 'u', 'dl', 'dx', 'dload', 'd_x', 'd_y', 'beta', 'kw',
+                   't', 'y_t', 'p', 'x_c', 'y_cb', 'y_cg', 'x_l', 'y_lb', 'y_lt', 'x_r', 'y_rb', 'y_rt',
+                   'r', 'xo', 'yo', 'n_eff', 'z', 'theta']
+    df[solver_cols] = df[solver_cols].astype(np.float64)
+
     # Slice data were built by iterating from left to right. Flip the order slice data for right-facing slopes.
     # Slice 1 should be at the bottom and slice n at the top. This makes the slice data consistent with the
     # sign convention for alpha and the free-body diagram used to calculate forces.
@@ -2,11 +2,86 @@ import numpy as np
 import pandas as pd
 from shapely.geometry import LineString, Point
 from math import sin, cos, tan, radians, atan, atan2, degrees
+from dataclasses import dataclass
 from scipy.optimize import minimize_scalar, root_scalar, newton
 from tabulate import tabulate
 
 
-def oms(df, debug=False):
+@dataclass
+class SliceArrays:
+    """
+    Contiguous float64 arrays of the slice quantities used by the solvers, one entry per slice.
+
+    Angles ('alpha', 'phi', 'beta') are stored in radians along with their sines, cosines and
+    tan(phi). Build it with prep_slice_arrays(df); the slice DataFrame stays the record used for
+    plotting and Excel export.
+    """
+    __slots__ = ('alpha', 'phi', 'beta', 'c', 'w', 'u', 'dl', 'dx', 'dload', 'd_x', 'd_y', 'kw', 't',
+                 'y_t', 'p', 'x_c', 'y_cb', 'y_cg', 'sin_alpha', 'cos_alpha', 'tan_phi', 'sin_beta',
+                 'cos_beta')
+
+    alpha: np.ndarray
+    phi: np.ndarray
+    beta: np.ndarray
+    c: np.ndarray
+    w: np.ndarray
+    u: np.ndarray
+    dl: np.ndarray
+    dx: np.ndarray
+    dload: np.ndarray
+    d_x: np.ndarray
+    d_y: np.ndarray
+    kw: np.ndarray
+    t: np.ndarray
+    y_t: np.ndarray
+    p: np.ndarray
+    x_c: np.ndarray
+    y_cb: np.ndarray
+    y_cg: np.ndarray
+    sin_alpha: np.ndarray
+    cos_alpha: np.ndarray
+    tan_phi: np.ndarray
+    sin_beta: np.ndarray
+    cos_beta: np.ndarray
+
+
+def prep_slice_arrays(df, fields=None):
+    """
+    Extracts the slice columns used by the solvers as contiguous float64 arrays and
+    precomputes the trigonometric terms of the slice angles.
+
+    Call this once per slice table and pass the result to each solver through its
+    `arrays` argument so that several methods run on the same slices do not repeat
+    the DataFrame lookups and trig evaluations.
+
+    Parameters:
+        df (pd.DataFrame): Slice table from generate_slices.
+        fields (iterable of str, optional): SliceArrays fields to build. The others are left
+            as None. All fields are built if omitted.
+
+    Returns:
+        SliceArrays: Slice quantities with 'alpha', 'phi' and 'beta' in radians.
+    """
+    trig = {
+        'sin_alpha': (np.sin, 'alpha'), 'cos_alpha': (np.cos, 'alpha'), 'tan_phi': (np.tan, 'phi'),
+        'sin_beta': (np.sin, 'beta'), 'cos_beta': (np.cos, 'beta'),
+    }
+    fields = set(SliceArrays.__slots__ if fields is None else fields)
+    values = dict.fromkeys(SliceArrays.__slots__)
+
+    # Columns and angles first, including any angle a requested trig term needs
+    for name in (fields - trig.keys()) | {trig[f][1] for f in fields & trig.keys()}:
+        if name in ('alpha', 'phi', 'beta'):
+            values[name] = np.radians(np.asarray(df[name].values, dtype=np.float64))
+        else:
+            values[name] = np.ascontiguousarray(df[name].values, dtype=np.float64)
+    for name in fields & trig.keys():
+        func, angle = trig[name]
+        values[name] = func(values[angle])
+    return SliceArrays(**values)
+
+
+def oms(df, debug=False, arrays=None):
     """
     Computes FS by direct application of Equation 9 (Ordinary Method of Slices).
 
@@ -30,6 +105,8 @@ def oms(df, debug=False):
           'x_c','y_cg'    = slice‐centroid (x,y) for seismic moment arm
           'r'             = radius of circular failure surface
           'xo','yo'       = x,y coordinates of circle center
+    arrays : SliceArrays, optional
+        Precomputed slice arrays from prep_slice_arrays(df). Built from df if omitted.
 
     Returns
     -------
@@ -58,35 +135,30 @@ def oms(df, debug=False):
     Yo = df['yo'].iloc[0]    # Yoᵢ (y-coordinate of circle center)
     R  = df['r'].iloc[0]     # Rᵢ (radius of circular failure surface)
 
-    # 2) Pull arrays directly from df
-    alpha_deg = df['alpha'].values    # αᵢ in degrees
-    phi_deg   = df['phi'].values      # φᵢ in degrees
-    c     = df['c'].values        # cᵢ
-    W     = df['w'].values        # Wᵢ
-    u     = df['u'].values        # uᵢ (pore‐force per unit length)
-    dl     = df['dl'].values       # Δℓᵢ
-    D     = df['dload'].values        # Dᵢ
-    d_x    = df['d_x'].values      # d_{x,i}
-    d_y    = df['d_y'].values      # d_{y,i}
-    beta_deg  = df['beta'].values     # βᵢ in degrees
-    kw    = df['kw'].values       # kWᵢ
-    T     = df['t'].values        # Tᵢ (zero except one slice)
-    y_t    = df['y_t'].values      # y_{t,i} (zero except one slice)
-    P     = df['p'].values        # pᵢ
-    x_c    = df['x_c'].values      # x_{c,i}
-    y_cg = df['y_cg'].values       # y_{cg,i} coordinate of slice centroid
-
-    # 3) Convert angles to radians
-    alpha = np.radians(alpha_deg)   # αᵢ [rad]
-    phi   = np.radians(phi_deg)     # φᵢ [rad]
-    beta  = np.radians(beta_deg)    # βᵢ [rad]
-
-    # 4) Precompute sines/cosines
-    sin_alpha = np.sin(alpha)          # sin(αᵢ)
-    cos_alpha = np.cos(alpha)          # cos(αᵢ)
-    sin_ab    = np.sin(alpha - beta)   # sin(αᵢ−βᵢ)
-    cos_ab    = np.cos(alpha - beta)   # cos(αᵢ−βᵢ)
-    tan_phi   = np.tan(phi)            # tan(φᵢ)
+    # 2) Pull arrays (angles already in radians)
+    if arrays is None:
+        arrays = prep_slice_arrays(df, ['alpha', 'beta', 'c', 'w', 'u', 'dl', 'dload', 'd_x', 'd_y', 'kw', 't', 'y_t',
+                                        'p', 'y_cg', 'sin_alpha', 'cos_alpha', 'tan_phi', 'sin_beta', 'cos_beta'])
+    alpha = arrays.alpha     # αᵢ [rad]
+    beta  = arrays.beta      # βᵢ [rad]
+    c     = arrays.c         # cᵢ
+    W     = arrays.w         # Wᵢ
+    u     = arrays.u         # uᵢ (pore‐force per unit length)
+    dl    = arrays.dl        # Δℓᵢ
+    D     = arrays.dload     # Dᵢ
+    d_x   = arrays.d_x       # d_{x,i}
+    d_y   = arrays.d_y       # d_{y,i}
+    kw    = arrays.kw        # kWᵢ
+    T     = arrays.t         # Tᵢ (zero except one slice)
+    y_t   = arrays.y_t       # y_{t,i} (zero except one slice)
+    P     = arrays.p         # pᵢ
+    y_cg  = arrays.y_cg      # y_{cg,i} coordinate of slice centroid
+
+    # 3) Precomputed sines/cosines
+    sin_alpha = arrays.sin_alpha   # sin(αᵢ)
+    cos_alpha = arrays.cos_alpha   # cos(αᵢ)
+    cos_ab    = np.cos(alpha - beta)  # cos(αᵢ−βᵢ)
+    tan_phi   = arrays.tan_phi     # tan(φᵢ)
 
     # ————————————————————————————————————————————————————————
     # 5) Build the NUMERATOR = Σᵢ [  cᵢ·Δℓᵢ
@@ -113,8 +185,8 @@ def oms(df, debug=False):
     #  (B) = Σ [ Dᵢ·cosβᵢ·(Xo - d_{x,i})  −  Dᵢ·sinβᵢ·(Yo - d_{y,i}) ]
     a_dx = d_x - Xo
     a_dy = Yo - d_y
-    sum_Dx = np.sum(D * np.cos(beta) * a_dx)
-    sum_Dy = np.sum(D * np.sin(beta) * a_dy)
+    sum_Dx = np.sum(D * arrays.cos_beta * a_dx)
+    sum_Dy = np.sum(D * arrays.sin_beta * a_dy)
 
     #  (C) = Σ [ kWᵢ * (Yo - y_{cg,i}) ]
     a_s = Yo - y_cg
@@ -146,7 +218,7 @@ def oms(df, debug=False):
     # 9) Return success and the FS
     return True, {'method': 'oms', 'FS': FS}
 
-def bishop(df, debug=False, tol=1e-6, max_iter=100):
+def bishop(df, debug=False, tol=1e-6, max_iter=100, arrays=None):
     """
     Computes FS using the complete Bishop's Simplified Method (Equation 10) and computes N_eff (Equation 8).
     Requires circular slip surface and full input data structure consistent with OMS.
@@ -156,6 +228,7 @@ def bishop(df, debug=False, tol=1e-6, max_iter=100):
         debug : bool, if True prints diagnostic info
         tol : float, convergence tolerance
         max_iter : int, maximum iteration steps
+        arrays : SliceArrays, optional precomputed slice arrays from prep_slice_arrays(df)
 
     Returns:
         (bool, dict | str): (True, {'method': 'bishop', 'FS': value}) or (False, error message)
@@ -170,29 +243,28 @@ def bishop(df, debug=False, tol=1e-6, max_iter=100):
     R  = df['r'].iloc[0]     # Rᵢ (radius of circular failure surface)
 
     # Load input arrays
-    alpha = np.radians(df['alpha'].values)
-    phi   = np.radians(df['phi'].values)
-    c     = df['c'].values
-    W     = df['w'].values
-    u     = df['u'].values
-    dl    = df['dl'].values
-    D     = df['dload'].values
-    d_x   = df['d_x'].values
-    d_y   = df['d_y'].values
-    beta  = np.radians(df['beta'].values)
-    kw    = df['kw'].values
-    T     = df['t'].values
-    y_t   = df['y_t'].values
-    P     = df['p'].values
-    x_c   = df['x_c'].values
-    y_cg  = df['y_cg'].values
+    if arrays is None:
+        arrays = prep_slice_arrays(df, ['c', 'w', 'u', 'dl', 'dload', 'd_x', 'd_y', 'kw', 't', 'y_t',
+                                        'p', 'y_cg', 'sin_alpha', 'cos_alpha', 'tan_phi', 'sin_beta', 'cos_beta'])
+    c     = arrays.c
+    W     = arrays.w
+    u     = arrays.u
+    dl    = arrays.dl
+    D     = arrays.dload
+    d_x   = arrays.d_x
+    d_y   = arrays.d_y
+    kw    = arrays.kw
+    T     = arrays.t
+    y_t   = arrays.y_t
+    P     = arrays.p
+    y_cg  = arrays.y_cg
 
     # Trigonometric terms
-    sin_alpha = np.sin(alpha)
-    cos_alpha = np.cos(alpha)
-    tan_phi   = np.tan(phi)
-    sin_beta  = np.sin(beta)
-    cos_beta  = np.cos(beta)
+    sin_alpha = arrays.sin_alpha
+    cos_alpha = arrays.cos_alpha
+    tan_phi   = arrays.tan_phi
+    sin_beta  = arrays.sin_beta
+    cos_beta  = arrays.cos_beta
 
     # Moment arms
     a_dx = d_x - Xo
@@ -208,28 +280,22 @@ def bishop(df, debug=False, tol=1e-6, max_iter=100):
     sum_T = np.sum(T * a_t)
     denominator = sum_W + (1.0 / R) * (sum_Dx - sum_Dy + sum_kw + sum_T)
 
+    # Terms of Equations (8) and (10) that do not depend on F
+    N_base = W + D * cos_beta - P * sin_alpha - u * dl * cos_alpha
+    c_dl_sin = c * dl * sin_alpha
+    sin_tan = sin_alpha * tan_phi
+    shear = c * dl * cos_alpha + N_base * tan_phi + P  # numerator for FS from Equation (10)
+
     # Iterative solution
     F = 1.0
     for _ in range(max_iter):
-        # Compute N_eff from Equation (8)
-        num_N = (
-            W + D * cos_beta - P * sin_alpha
-            - u * dl * cos_alpha
-            - (c * dl * sin_alpha) / F
-        )
-        denom_N = cos_alpha + (sin_alpha * tan_phi) / F
-        N_eff = num_N / denom_N
-
-        # Numerator for FS from Equation (10)
-        shear = (
-            c * dl * cos_alpha
-            + (W + D * cos_beta - P * sin_alpha - u * dl * cos_alpha) * tan_phi
-            + P
-        )
+        denom_N = cos_alpha + sin_tan / F
         numer_slice = shear / denom_N
         F_new = np.sum(numer_slice) / denominator
 
         if abs(F_new - F) < tol:
+            # N_eff from Equation (8)
+            N_eff = (N_base - c_dl_sin / F) / denom_N
             df['n_eff'] = N_eff
             if debug:
                 print(f"FS = {F_new:.6f}")
@@ -242,7 +308,7 @@ def bishop(df, debug=False, tol=1e-6, max_iter=100):
 
     return False, "Bishop method did not converge within the maximum number of iterations."
 
-def janbu(df, debug=False):
+def janbu(df, debug=False, arrays=None):
     """
     Computes FS using Janbu's Simplified Method with correction factor (Equation 7).
 
@@ -253,6 +319,7 @@ def janbu(df, debug=False):
     Parameters:
         df : pandas.DataFrame with required columns (see OMS spec)
         debug : bool, if True prints diagnostic info
+        arrays : SliceArrays, optional precomputed slice arrays from prep_slice_arrays(df)
 
     Returns:
         (bool, dict | str): (True, {'method': 'janbu_simplified', 'FS': value, 'fo': correction_factor})
@@ -260,22 +327,24 @@ def janbu(df, debug=False):
     """
 
     # Load input arrays
-    alpha = np.radians(df['alpha'].values)
-    phi = np.radians(df['phi'].values)
-    c = df['c'].values
-    W = df['w'].values
-    u = df['u'].values
-    dl = df['dl'].values
-    D = df['dload'].values
-    beta = np.radians(df['beta'].values)
-    kw = df['kw'].values
-    T = df['t'].values
-    P = df['p'].values
+    if arrays is None:
+        arrays = prep_slice_arrays(df, ['alpha', 'beta', 'c', 'w', 'u', 'dl', 'dload', 'kw', 't', 'p', 'x_c', 'y_cb',
+                                        'sin_alpha', 'cos_alpha', 'tan_phi'])
+    alpha = arrays.alpha
+    c = arrays.c
+    W = arrays.w
+    u = arrays.u
+    dl = arrays.dl
+    D = arrays.dload
+    beta = arrays.beta
+    kw = arrays.kw
+    T = arrays.t
+    P = arrays.p
 
     # Trigonometric terms
-    sin_alpha = np.sin(alpha)
-    cos_alpha = np.cos(alpha)
-    tan_phi = np.tan(phi)
+    sin_alpha = arrays.sin_alpha
+    cos_alpha = arrays.cos_alpha
+    tan_phi = arrays.tan_phi
     sin_beta_alpha = np.sin(beta - alpha)
     cos_beta_alpha = np.cos(beta - alpha)
 
@@ -306,8 +375,8 @@ def janbu(df, debug=False):
     L = np.hypot(x_r - x_l, y_rt - y_lt)
 
     # Calculate perpendicular distance from each slice center to failure surface line
-    x0 = df['x_c'].values
-    y0 = df['y_cb'].values
+    x0 = arrays.x_c
+    y0 = arrays.y_cb
 
     # Distance from point to line formula: |ax + by + c| / sqrt(a² + b²)
     # Line equation: (y_rt - y_lt)x - (x_r - x_l)y + (x_r * y_lt - y_rt * x_l) = 0
@@ -354,7 +423,7 @@ def janbu(df, debug=False):
     }
 
 
-def force_equilibrium(df, theta_list, fs_guess=1.5, tol=1e-6, max_iter=50, debug=False):
+def force_equilibrium(df, theta_list, fs_guess=1.5, tol=1e-6, max_iter=50, debug=False, arrays=None):
     """
     Limit‐equilibrium by force equilibrium in X & Y with variable interslice angles.
 
@@ -377,6 +446,7 @@ def force_equilibrium(df, theta_list, fs_guess=1.5, tol=1e-6, max_iter=50, debug
         tol (float): convergence tolerance on residual
         max_iter (int): maximum number of Newton (secant) iterations
         debug (bool): print residuals during iteration
+        arrays (SliceArrays, optional): precomputed slice arrays from prep_slice_arrays(df)
 
     Returns:
         (bool, dict or str):
@@ -389,59 +459,50 @@ def force_equilibrium(df, theta_list, fs_guess=1.5, tol=1e-6, max_iter=50, debug
     if len(theta_list) != n+1:
         return False, f"theta_list length ({len(theta_list)}) must be n+1 ({n+1})"
 
-    # extract and convert to radians
-    alpha   = np.radians(df['alpha'].values)
-    phi     = np.radians(df['phi'].values)
-    c       = df['c'].values
-    w       = df['w'].values
-    u       = df['u'].values
-    dl      = df['dl'].values
-    D       = df['dload'].values
-    beta    = np.radians(df['beta'].values)
-    kw      = df['kw'].values
-    T       = df['t'].values
-    P       = df['p'].values
+    # extract slice arrays (angles in radians)
+    if arrays is None:
+        arrays = prep_slice_arrays(df, ['c', 'w', 'u', 'dl', 'dload', 'kw', 't', 'p',
+                                        'sin_alpha', 'cos_alpha', 'tan_phi', 'sin_beta', 'cos_beta'])
+    c       = arrays.c
+    w       = arrays.w
+    u       = arrays.u
+    dl      = arrays.dl
+    D       = arrays.dload
+    kw      = arrays.kw
+    T       = arrays.t
+    P       = arrays.p
     theta   = np.radians(np.asarray(theta_list))
     N = np.zeros(n)  # normal forces on slice bases
     Z = np.zeros(n+1)  # interslice forces, Z[0] = 0 by definition (no force entering leftmost slice)
 
+    # FS-independent terms of equations (6) and (7), computed once
+    ca, sa = arrays.cos_alpha, arrays.sin_alpha
+    cb, sb = arrays.cos_beta, arrays.sin_beta
+    cos_t, sin_t = np.cos(theta).tolist(), np.sin(theta).tolist()
+    tan_phi = arrays.tan_phi
+    b0_const = (-P*ca + u*dl*sa - D*sb + kw + T).tolist()
+    b1_const = (-P*sa - u*dl*ca + w + D*cb).tolist()
+    cdl_ca, cdl_sa = c*dl*ca, c*dl*sa
+
     def residual(FS):
         """Return the right‐side interslice force Z[n] for a given FS."""
-        c_m       = c / FS
-        tan_phi_m = np.tan(phi) / FS
-        Z[:] = 0.0  # reset Z for each call
+        # Matrix A coefficients and vector b from equations (6) and (7)
+        a11 = (tan_phi*ca/FS - sa).tolist()
+        a21 = (tan_phi*sa/FS + ca).tolist()
+        b0 = (b0_const - cdl_ca/FS).tolist()
+        b1 = (b1_const - cdl_sa/FS).tolist()
+        Z_i = 0.0
+        Z[0] = 0.0
         for i in range(n):
-            ca, sa = np.cos(alpha[i]), np.sin(alpha[i])
-            cb, sb = np.cos(beta[i]), np.sin(beta[i])
-            
-            # Matrix A coefficients from equations (6) and (7)
-            A = np.array([
-                [tan_phi_m[i]*ca - sa,   -np.cos(theta[i+1])],
-                [tan_phi_m[i]*sa + ca,   -np.sin(theta[i+1])]
-            ])
-            
-            # Vector b from equations (6) and (7)
-            b0 = (
-                -c_m[i]*dl[i]*ca 
-                - P[i]*ca 
-                + u[i]*dl[i]*sa 
-                - Z[i]*np.cos(theta[i]) 
-                - D[i]*sb 
-                + kw[i] 
-                + T[i]
-            )
-            b1 = (
-                -c_m[i]*dl[i]*sa 
-                - P[i]*sa 
-                - u[i]*dl[i]*ca 
-                + w[i] 
-                - Z[i]*np.sin(theta[i]) 
-                + D[i]*cb
-            )
-            
-            N_i, Z_ip1 = np.linalg.solve(A, np.array([b0, b1]))
-            Z[i+1] = Z_ip1
-            N[i] = N_i  # store normal force on slice base
+            a12, a22 = -cos_t[i+1], -sin_t[i+1]
+            r0 = b0[i] - Z_i*cos_t[i]
+            r1 = b1[i] - Z_i*sin_t[i]
+
+            # Solve the 2x2 system A·[N_i, Z_i+1] = r directly (Cramer's rule)
+            det = a11[i]*a22 - a12*a21[i]
+            N[i] = (r0*a22 - a12*r1) / det  # store normal force on slice base
+            Z_i = (a11[i]*r1 - a21[i]*r0) / det
+            Z[i+1] = Z_i
         return Z[n]
 
     if debug:
@@ -463,7 +524,7 @@ def force_equilibrium(df, theta_list, fs_guess=1.5, tol=1e-6, max_iter=50, debug
 
     return True, {'FS': FS_opt}
 
-def corps_engineers(df, debug=False):
+def corps_engineers(df, debug=False, arrays=None):
     """
     Corps of Engineers style force equilibrium solver.
 
@@ -476,6 +537,7 @@ def corps_engineers(df, debug=False):
         df (pd.DataFrame): Must include at least ['x_l','y_lt','x_r','y_rt']
                            plus all the columns required by force_equilibrium:
                            ['alpha','phi','c','dl','w','u','dx'].
+        arrays (SliceArrays, optional): precomputed slice arrays from prep_slice_arrays(df).
 
     Returns:
         Tuple(bool, dict or str): Whatever force_equilibrium returns.
@@ -499,7 +561,7 @@ def corps_engineers(df, debug=False):
     df['theta'] = theta_list[:-1]  # store theta in df. Adjust length to n slices.
 
     # delegate to your force_equilibrium solver
-    success, results = force_equilibrium(df, theta_list, debug=debug)
+    success, results = force_equilibrium(df, theta_list, debug=debug, arrays=arrays)
     if not success:
         return success, results
     else:
@@ -507,7 +569,7 @@ def corps_engineers(df, debug=False):
         results['theta'] = theta_deg           # append theta
         return success, results
 
-def lowe_karafiath(df, debug=False):
+def lowe_karafiath(df, debug=False, arrays=None):
     """
     Lowe-Karafiath limit equilibrium: variable interslice inclinations equal to
     the average of the top‐and bottom‐surface slopes of the two adjacent slices
@@ -562,14 +624,14 @@ def lowe_karafiath(df, debug=False):
     df['theta'] = theta_list[:-1]  # store theta in df. Adjust length to n slices.
 
     # call your force_equilibrium solver
-    success, results = force_equilibrium(df, theta_list, debug=debug)
+    success, results = force_equilibrium(df, theta_list, debug=debug, arrays=arrays)
     if not success:
         return success, results
     else:
         results['method'] = 'lowe_karafiath'  # append method
         return success, results
 
-def spencer(df, tol=1e-6, debug=False):
+def spencer(df, tol=1e-6, debug=False, arrays=None, max_iter=100):
     """
     Spencer's Method using Steve G. Wright's formulation.
     Solves for FS_force and FS_moment independently using the Wright Q equation.
@@ -587,6 +649,11 @@ def spencer(df, tol=1e-6, debug=False):
             'kw'    (seismic force),
             't'     (tension crack water force),
             'p'     (reinforcement force)
+        tol (float): solver tolerance; the xatol of the bounded minimisation for FS at a given theta,
+            the tolerance on theta for the Newton/brentq root solve, and the threshold of the final
+            FS_force vs FS_moment converged check
+        arrays (SliceArrays, optional): precomputed slice arrays from prep_slice_arrays(df)
+        max_iter (int): maximum iterations for the Newton solve on theta
 
     Returns:
         float: FS where FS_force = FS_moment
@@ -597,63 +664,63 @@ def spencer(df, tol=1e-6, debug=False):
     # Check if the 'r' column is present in df. If so, circular = True.
     circular = 'r' in df.columns
 
-    tol = 1e-6
-    max_iter = 100
-
-    alpha = np.radians(df['alpha'].values)
-    phi   = np.radians(df['phi'].values)
-    c     = df['c'].values
-    dx    = df['dx'].values
-    dl    = df['dl'].values
-    w     = df['w'].values
-    u     = df['u'].values
-    x_c   = df['x_c'].values
-    y_cb  = df['y_cb'].values
-    D     = df['dload'].values
-    beta  = np.radians(df['beta'].values)
-    kw    = df['kw'].values
-    T     = df['t'].values
-    P     = df['p'].values
-    cos_a = np.cos(alpha)
-    sin_a = np.sin(alpha)
-    tan_p = np.tan(phi)
-
-    def compute_Q(F, theta_rad):
-        term1 = w * sin_a + kw * cos_a + T * cos_a - P - D * np.sin(beta - alpha)
-        term2 = (c / F) * dl
-        term3 = (w * cos_a + D * np.cos(beta - alpha) - kw * sin_a - T * sin_a - u * dl) * tan_p / F
-        numerator = term1 - term2 - term3
+    if arrays is None:
+        arrays = prep_slice_arrays(df, ['alpha', 'phi', 'beta', 'c', 'w', 'u', 'dl', 'dload', 'kw', 't', 'p', 'x_c', 'y_cb',
+                                        'sin_alpha', 'cos_alpha', 'tan_phi'])
+    alpha = arrays.alpha
+    phi   = arrays.phi
+    c     = arrays.c
+    dl    = arrays.dl
+    w     = arrays.w
+    u     = arrays.u
+    x_c   = arrays.x_c
+    y_cb  = arrays.y_cb
+    D     = arrays.dload
+    beta  = arrays.beta
+    kw    = arrays.kw
+    T     = arrays.t
+    P     = arrays.p
+    cos_a = arrays.cos_alpha
+    sin_a = arrays.sin_alpha
+    tan_p = arrays.tan_phi
+
+    # Terms of the Q equation that depend on neither F nor theta, computed once
+    q_drive = w * sin_a + kw * cos_a + T * cos_a - P - D * np.sin(beta - alpha)
+    q_resist = c * dl + (w * cos_a + D * np.cos(beta - alpha) - kw * sin_a - T * sin_a - u * dl) * tan_p
+
+    def theta_terms(theta_rad):
+        """Theta-dependent terms shared by the force and moment solutions at one theta."""
         theta_diff = alpha - theta_rad
-        denominator = np.cos(theta_diff) * (1 + (np.tan(theta_diff) * tan_p) / F)
-        Q = numerator / denominator
-        return Q
+        cos_td = np.cos(theta_diff)
+        sin_td_tan_p = np.sin(theta_diff) * tan_p
+        if circular:
+            moment_arm = cos_td
+        else:
+            moment_arm = -x_c * np.sin(theta_rad) + y_cb * np.cos(theta_rad)
+        return cos_td, sin_td_tan_p, moment_arm
+
+    def compute_Q(F, terms):
+        cos_td, sin_td_tan_p, _ = terms
+        # cos(α-θ)·(1 + tan(α-θ)·tanφ/F) = cos(α-θ) + sin(α-θ)·tanφ/F
+        return (q_drive - q_resist / F) / (cos_td + sin_td_tan_p / F)
 
     fs_min = 0.01
     fs_max = 20.0
 
-    def fs_force(theta_rad):
-        def residual(F):
-            Q = compute_Q(F, theta_rad)
-            return Q.sum()
+    def solve_fs(residual):
         result = minimize_scalar(lambda F: abs(residual(F)), bounds=(fs_min, fs_max), method='bounded', options={'xatol': tol})
         return result.x
 
-    def fs_moment(theta_rad):
-        def residual(F):
-            Q = compute_Q(F, theta_rad)
-            if circular:
-                theta_diff = alpha - theta_rad
-                return np.sum(Q * np.cos(theta_diff))
-            else:
-                return np.sum(-Q * x_c * np.sin(theta_rad) + Q * y_cb * np.cos(theta_rad))
-        result = minimize_scalar(lambda F: abs(residual(F)), bounds=(fs_min, fs_max), method='bounded', options={'xatol': tol})
-        return result.x
+    def fs_force(terms):
+        return solve_fs(lambda F: compute_Q(F, terms).sum())
+
+    def fs_moment(terms):
+        moment_arm = terms[2]
+        return solve_fs(lambda F: np.dot(compute_Q(F, terms), moment_arm))
 
     def fs_difference(theta_deg):
-        theta_rad = np.radians(theta_deg)
-        Ff = fs_force(theta_rad)
-        Fm = fs_moment(theta_rad)
-        return Ff - Fm
+        terms = theta_terms(np.radians(theta_deg))
+        return fs_force(terms) - fs_moment(terms)
 
     # First try Newton's method to find theta_opt
     try:
@@ -665,7 +732,7 @@ def spencer(df, tol=1e-6, debug=False):
         if (
             abs(theta_opt) > 59 or
             abs(fs_difference(theta_opt)) > 0.01 or
-            fs_force(np.radians(theta_opt)) >= fs_max - 1e-3
+            fs_force(theta_terms(np.radians(theta_opt))) >= fs_max - 1e-3
         ):
             raise ValueError("Newton's method converged to an invalid solution, trying sweep...")
     except Exception:
@@ -691,13 +758,14 @@ def spencer(df, tol=1e-6, debug=False):
             return False, f"Spencer's method failed to converge: {e}"
 
     theta_rad = np.radians(theta_opt)
-    FS_force = fs_force(theta_rad)
-    FS_moment = fs_moment(theta_rad)
+    terms = theta_terms(theta_rad)
+    FS_force = fs_force(terms)
+    FS_moment = fs_moment(terms)
 
     df['theta'] = theta_opt  # store theta in df.
 
     # Simplified method for computing N_eff
-    Q = compute_Q(FS_force, theta_rad)
+    Q = compute_Q(FS_force, terms)
     N_eff = w * cos_a + D * np.cos(beta - alpha) + Q * np.sin(alpha - theta_rad) - kw * sin_a - T * sin_a - u * dl 
 
     # ---  compute interslice forces Z  ---